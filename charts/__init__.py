@@ -0,0 +1,2 @@
+from .dispatch import determine_chart_type, determine_chat_chart_type, determine_pivot_chart_type
+from .render import TEXT_AUTO_MAX_CELLS, build_figure, frame_key, generate_chart, lttb, pivot_mean
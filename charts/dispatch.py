@@ -0,0 +1,126 @@
+import functools
+import pandas as pd
+import numpy as np
+
+# Column names that mark a frame as time-based
+_TIME_WORDS = frozenset({'month', 'year', 'date', 'time', 'day'})
+
+# Chart decision table keyed on (ncols, num_cols, cat_cols, nrows > 10), with counts
+# clamped to the highest value any rule distinguishes. Built once at import.
+# Heatmap, bubble, radar, area, dot, treemap and gauge used to be checked after rules
+# that already matched every frame they could apply to, so they are no longer listed.
+_RULES = {}
+for _rows in (0, 1):
+    _RULES[(1, 1, 0, _rows)] = 'histogram'
+    _RULES[(2, 2, 0, _rows)] = 'scatter'
+    _RULES[(2, 1, 1, _rows)] = 'pie' if _rows == 0 else 'bar'
+    _RULES[(3, 1, 2, _rows)] = 'bar'
+    for _cat in (0, 1, 2):
+        _RULES[(3, 2, _cat, _rows)] = 'scatter'
+
+def determine_chart_type(df):
+    """
+    Determine the most suitable chart type based on the structure of the DataFrame.
+
+    Parameters:
+    df (pd.DataFrame): The input DataFrame containing data to be visualized.
+
+    Returns:
+    str: The suggested chart type. Returns None if no suitable chart type is found.
+
+    Raises:
+    ValueError: If the input is not a pandas DataFrame or if the DataFrame is empty.
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError("Input must be a pandas DataFrame.")
+    if 0 in df.shape:
+        raise ValueError("Input DataFrame is empty.")
+
+    return _determine(tuple(df.columns), tuple(df.dtypes), df.shape[0])
+
+# The decision only depends on the schema, so reruns over the same (columns, dtypes, nrows) skip the dtype probing
+@functools.lru_cache(maxsize=128)
+def _determine(columns, dtypes, nrows):
+    is_num = np.fromiter((pd.api.types.is_numeric_dtype(t) for t in dtypes), dtype=bool, count=len(dtypes))
+    ncols = len(dtypes)
+    num_cols_count = int(is_num.sum())
+    cat_cols_count = ncols - num_cols_count
+
+    key = (min(ncols, 3), min(num_cols_count, 2), min(cat_cols_count, 2), 0 if nrows <= 10 else 1)
+    chart = _RULES.get(key)
+
+    # Pie wins over the time-based line check; everything else is decided by the table
+    if chart == 'pie':
+        return chart
+
+    # Check for Line Chart: Time-based or sequential data with at least one numerical column
+    if ncols >= 2 and num_cols_count > 0:
+        if pd.Index(columns).str.lower().isin(_TIME_WORDS).any():
+            return 'line'
+
+    return chart
+
+def determine_pivot_chart_type(df):
+    """
+    Determine the chart type with the pivot rules: two key columns and a value make a heatmap.
+
+    Parameters:
+    df (pd.DataFrame): The input DataFrame.
+
+    Returns:
+    str: The chart type ('bar', 'pie', 'line', 'scatter', 'heatmap', or 'histogram'), or None.
+    """
+    nrows, ncols = df.shape
+    # Empty frames have nothing to plot; answer before touching dtypes or the cache
+    if nrows == 0 or ncols == 0:
+        return None
+    return _decide_pivot(ncols, tuple(df.dtypes.iloc[:3]), nrows <= 10)
+
+# The pivot rules only look at the column count, the first three dtypes and whether the
+# frame has at most 10 rows, so frames sharing that fingerprint reuse one cached decision
+@functools.lru_cache(maxsize=256)
+def _decide_pivot(ncols, head_dtypes, small):
+    is_num = np.fromiter((pd.api.types.is_numeric_dtype(t) for t in head_dtypes), dtype=bool, count=len(head_dtypes))
+
+    if ncols == 1:
+        if is_num[0]:
+            return 'histogram'
+    elif ncols == 2:
+        if is_num[0] and is_num[1]:
+            return 'scatter'
+        # Small frames get a pie before the bar rule can claim them
+        elif is_num[1] and small:
+            return 'pie'
+        elif is_num[1]:
+            return 'bar'
+    else:
+        if not is_num[0] and not is_num[1] and is_num[2]:
+            return 'heatmap'
+        elif is_num[1]:
+            return 'line'
+    return None
+
+def determine_chat_chart_type(df):
+    """
+    Determine the chart type with the chat rules, which only pick bar, pie and line charts.
+
+    Parameters:
+    df (pd.DataFrame): The input DataFrame.
+
+    Returns:
+    str: The chart type ('bar', 'pie' or 'line'), or None.
+    """
+    nrows, ncols = df.shape
+    if nrows == 0 or ncols < 2:
+        return None
+    return _decide_chat(min(ncols, 3), df.dtypes.iloc[1], nrows > 1)
+
+# Only the column count (2 or more), the second dtype and whether there is more than one
+# row matter, so the cache stays tiny
+@functools.lru_cache(maxsize=64)
+def _decide_chat(ncols, second_dtype, multi_row):
+    if not pd.api.types.is_numeric_dtype(second_dtype):
+        return None
+    if ncols == 2:
+        return 'bar' if multi_row else 'pie'
+    return 'line'
@@ -0,0 +1,426 @@
+import hashlib
+import pandas as pd
+import streamlit as st
+import numpy as np
+
+# Shared look for every figure, applied in one update_layout call once the figure is built
+_LAYOUT = dict(template="plotly_white", plot_bgcolor="rgba(0,0,0,0)")
+
+# Scatter and line charts from more rows than this are drawn with WebGL instead of SVG
+_WEBGL_THRESHOLD = 5000
+
+# Line charts longer than this are downsampled before being sent to the browser
+_DOWNSAMPLE_THRESHOLD = 5000
+_DOWNSAMPLE_POINTS = 2000
+
+# Histograms without an explicit bin size never get more bins than this
+_MAX_AUTO_BINS = 256
+
+# Heatmaps with more cells than this (about 20x20) skip the per-cell value labels, one DOM
+# node each; the values are still shown by the heatmap's hover text
+TEXT_AUTO_MAX_CELLS = 400
+
+def lttb(x, y, n_out):
+    """
+    Pick the points of a line that best keep its shape (largest-triangle-three-buckets).
+
+    Parameters:
+    x (np.ndarray): The x values, in plotting order.
+    y (np.ndarray): The y values.
+    n_out (int): The number of points to keep.
+
+    Returns:
+    np.ndarray: The indices of the kept points, first and last included.
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64) if np.issubdtype(x.dtype, np.number) else np.arange(n, dtype=np.float64)
+    y = y.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+def pivot_mean(rows, cols, values):
+    """
+    Average values over every (row, column) key pair, like DataFrame.pivot_table's default.
+
+    Parameters:
+    rows (pd.Series): The keys for the matrix rows.
+    cols (pd.Series): The keys for the matrix columns.
+    values (pd.Series): The values to average.
+
+    Returns:
+    tuple: The float32 matrix (NaN where a pair never occurs), the row labels and the column labels.
+    The matrix is int16 instead when every cell holds a small whole number, such as counts.
+    """
+    r, row_labels = pd.factorize(rows, sort=True)
+    c, col_labels = pd.factorize(cols, sort=True)
+    v = values.to_numpy(dtype=np.float32, na_value=np.nan)
+
+    # Missing keys factorize to -1 and missing values are skipped, as pivot_table does
+    valid = (r >= 0) & (c >= 0) & ~np.isnan(v)
+    r, c, v = r[valid], c[valid], v[valid]
+
+    sums = np.zeros((row_labels.size, col_labels.size), dtype=np.float32)
+    counts = np.zeros(sums.shape, dtype=np.int64)
+    np.add.at(sums, (r, c), v)
+    np.add.at(counts, (r, c), 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        matrix = np.where(counts > 0, sums / counts, np.nan).astype(np.float32)
+
+    # Whole-number grids with no gaps fit in int16, halving the payload Plotly encodes again
+    info = np.iinfo(np.int16)
+    if (matrix.size and not np.isnan(matrix).any() and (matrix == np.round(matrix)).all()
+            and info.min <= matrix.min() and matrix.max() <= info.max):
+        matrix = matrix.astype(np.int16)
+    return matrix, row_labels, col_labels
+
+def _correlation(df):
+    """
+    Pearson correlation matrix of the numeric columns of a DataFrame.
+
+    Parameters:
+    df (pd.DataFrame): The input DataFrame.
+
+    Returns:
+    pd.DataFrame: The correlation matrix labelled by column name.
+    """
+    numeric = df.select_dtypes(include=[np.number])
+    X = numeric.to_numpy(dtype=np.float32, na_value=np.nan)
+
+    # DataFrame.corr handles missing values pairwise, which a single matrix product can't
+    if np.isnan(X).any() or X.shape[0] < 2:
+        return numeric.astype("float32").corr()
+
+    X = X - X.mean(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        X /= X.std(axis=0, ddof=1)
+    corr = (X.T @ X) / (X.shape[0] - 1)
+    return pd.DataFrame(corr, index=numeric.columns, columns=numeric.columns)
+
+def _maybe_gl(x, y, mode, n_points):
+    """
+    Build a scatter/line trace, switching to WebGL when the source data has too many points for SVG.
+
+    Parameters:
+    x (np.ndarray): The x values.
+    y (np.ndarray): The y values.
+    mode (str): The trace mode ('markers', 'lines', 'lines+markers').
+    n_points (int): The number of points in the source data.
+
+    Returns:
+    plotly.graph_objects.Scatter or plotly.graph_objects.Scattergl: The trace.
+    """
+    import plotly.graph_objects as go
+    trace = go.Scattergl if n_points > _WEBGL_THRESHOLD else go.Scatter
+    return trace(x=x, y=y, mode=mode)
+
+def _set_axis_titles(fig, opts, y=True):
+    fig.update_xaxes(title=opts['x_label'])
+    if y:
+        fig.update_yaxes(title=opts['y_label'])
+
+# Each builder takes the frame, its first three column names and the display options,
+# and imports plotly itself so nothing is loaded until a chart is actually drawn
+
+def _build_bar(df, c0, c1, c2, opts):
+    import plotly.express as px
+    import plotly.graph_objects as go
+    # One trace coloured per category instead of px's one trace per category
+    codes, _ = pd.factorize(df.iloc[:, 0])
+    palette = px.colors.qualitative.Plotly
+    fig = go.Figure(go.Bar(x=df.iloc[:, 0].to_numpy(), y=df.iloc[:, 1].to_numpy(),
+                           marker_color=[palette[code % len(palette)] for code in codes]))
+    fig.update_layout(title=opts['title'] or f"{c0} vs. {c1}")
+    _set_axis_titles(fig, opts)
+    return fig
+
+def _build_pie(df, c0, c1, c2, opts):
+    import plotly.express as px
+    return px.pie(df, names=c0, values=c1,
+                  title=opts['title'] or f"Distribution of {c0}")
+
+def _build_line(df, c0, c1, c2, opts):
+    import plotly.graph_objects as go
+    x = df.iloc[:, 0].to_numpy()
+    y = df.iloc[:, 1].to_numpy()
+    n_points = len(y)
+    # LTTB needs numeric y; text value columns are drawn in full, as px.line did
+    if n_points > _DOWNSAMPLE_THRESHOLD and pd.api.types.is_numeric_dtype(df.iloc[:, 1]):
+        keep = lttb(x, y, _DOWNSAMPLE_POINTS)
+        fig = go.Figure(_maybe_gl(x[keep], y[keep], "lines", n_points))
+    else:
+        fig = go.Figure(_maybe_gl(x, y, "lines+markers", n_points))
+    fig.update_layout(title=opts['title'] or f"{c1} Over {c0}")
+    _set_axis_titles(fig, opts)
+    return fig
+
+def _build_scatter(df, c0, c1, c2, opts):
+    import plotly.graph_objects as go
+    fig = go.Figure(_maybe_gl(df.iloc[:, 0].to_numpy(), df.iloc[:, 1].to_numpy(), "markers", df.shape[0]))
+    fig.update_layout(title=opts['title'] or f"{c0} vs. {c1}")
+    _set_axis_titles(fig, opts)
+    return fig
+
+def _build_heatmap(df, c0, c1, c2, opts):
+    import plotly.express as px
+    # The first two columns are the grid keys and the third holds the values averaged into each cell
+    matrix, row_labels, col_labels = pivot_mean(df.iloc[:, 0], df.iloc[:, 1], df.iloc[:, 2])
+    return px.imshow(matrix, x=col_labels, y=row_labels,
+                     text_auto=matrix.size <= TEXT_AUTO_MAX_CELLS,
+                     title=opts['title'] or f"Heatmap of {c0} vs. {c1}",
+                     color_continuous_scale=opts['color_scale'] or "Viridis")
+
+def _build_correlation(df, c0, c1, c2, opts):
+    import plotly.express as px
+    corr_matrix = _correlation(df)
+    return px.imshow(corr_matrix,
+                     x=corr_matrix.columns,
+                     y=corr_matrix.index,
+                     title=opts['title'] or "Heatmap of Numerical Features",
+                     color_continuous_scale=opts['color_scale'] or "Viridis")
+
+def _build_histogram(df, c0, c1, c2, opts):
+    import plotly.express as px
+    import plotly.graph_objects as go
+    title = opts['title'] or f"Histogram of {c0}"
+    if not pd.api.types.is_numeric_dtype(df.iloc[:, 0]):
+        fig = px.histogram(df, x=c0, title=title, nbins=opts['bin_size'])
+        _set_axis_titles(fig, opts, y=False)
+        return fig
+
+    # Bin on the server and send only the bin counts, not every raw value. Without a
+    # bin size NumPy picks the bins, like Plotly's auto-binning, up to _MAX_AUTO_BINS
+    x = df.iloc[:, 0].dropna().to_numpy(dtype=np.float64)
+    bins = opts['bin_size']
+    if bins is None:
+        bins = min(np.histogram_bin_edges(x, bins="auto").size - 1, _MAX_AUTO_BINS)
+    counts, edges = np.histogram(x, bins=bins)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+    fig.update_layout(title=title, bargap=0)
+    fig.update_yaxes(title="count")
+    _set_axis_titles(fig, opts, y=False)
+    return fig
+
+def _build_boxplot(df, c0, c1, c2, opts):
+    import plotly.express as px
+    fig = px.box(df, x=c0, y=c1,
+                 title=opts['title'] or f"Boxplot of {c0} vs. {c1}")
+    _set_axis_titles(fig, opts)
+    return fig
+
+def _build_violinplot(df, c0, c1, c2, opts):
+    import plotly.express as px
+    fig = px.violin(df, x=c0, y=c1,
+                    title=opts['title'] or f"Violinplot of {c0} vs. {c1}")
+    _set_axis_titles(fig, opts)
+    return fig
+
+def _build_densityplot(df, c0, c1, c2, opts):
+    import plotly.express as px
+    fig = px.density_heatmap(df, x=c0, y=c1,
+                             title=opts['title'] or f"Densityplot of {c0} vs. {c1}")
+    _set_axis_titles(fig, opts)
+    return fig
+
+def _build_treemap(df, c0, c1, c2, opts):
+    import plotly.express as px
+    # Three columns give an explicit hierarchy; two columns hang every label off a single root
+    if c2 is not None:
+        return px.treemap(df, names=c0, parents=c1, values=c2,
+                          title=opts['title'] or f"Treemap of {c0} vs. {c1}")
+    fig = px.treemap(df, names=c0, parents=[''] * len(df), values=c1,
+                     title=opts['title'] or f"Treemap of {c0}")
+    fig.update_layout(margin=dict(t=50, l=25, r=25, b=25))
+    return fig
+
+def _build_sunburst(df, c0, c1, c2, opts):
+    import plotly.express as px
+    return px.sunburst(df, names=c0, parents=c1, values=c2,
+                       title=opts['title'] or f"Sunburst of {c0} vs. {c1}")
+
+def _build_waterfall(df, c0, c1, c2, opts):
+    import plotly.graph_objects as go
+    title = opts['title'] or f"Waterfall of {c0} vs. {c1}"
+    fig = go.Figure(go.Waterfall(
+        x=df.iloc[:, 0].to_numpy(),
+        y=df.iloc[:, 1].to_numpy(),
+        name=title
+    ))
+    fig.update_layout(title=title,
+                      xaxis_title=opts['x_label'],
+                      yaxis_title=opts['y_label'])
+    return fig
+
+def _build_funnel(df, c0, c1, c2, opts):
+    import plotly.express as px
+    fig = px.funnel(df, x=c0, y=c1,
+                    title=opts['title'] or f"Funnel of {c0} vs. {c1}")
+    _set_axis_titles(fig, opts)
+    return fig
+
+def _build_sankey(df, c0, c1, c2, opts):
+    import plotly.graph_objects as go
+    # Plotly Express has no sankey; go.Sankey wants links as indices into one node list
+    codes, nodes = pd.factorize(pd.concat([df.iloc[:, 0], df.iloc[:, 1]], ignore_index=True))
+    fig = go.Figure(go.Sankey(
+        node=dict(label=nodes.to_numpy()),
+        link=dict(source=codes[:len(df)], target=codes[len(df):], value=df.iloc[:, 2].to_numpy())
+    ))
+    fig.update_layout(title=opts['title'] or f"Sankey of {c0} vs. {c1}")
+    return fig
+
+def _build_bubble(df, c0, c1, c2, opts):
+    import plotly.express as px
+    fig = px.scatter(df, x=c0, y=c1, size=c2,
+                     title=opts['title'] or f"{c0} vs. {c1}")
+    _set_axis_titles(fig, opts)
+    return fig
+
+def _build_radar(df, c0, c1, c2, opts):
+    import plotly.express as px
+    fig = px.line_polar(df, r=c1, theta=c0,
+                        title=opts['title'] or f"{c1} by {c0}")
+    fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0, df[c1].max() * 1.1])))
+    return fig
+
+def _build_area(df, c0, c1, c2, opts):
+    import plotly.express as px
+    fig = px.area(df, x=c0, y=c1,
+                  title=opts['title'] or f"{c1} Over {c0}")
+    _set_axis_titles(fig, opts)
+    return fig
+
+def _build_gauge(df, c0, c1, c2, opts):
+    import plotly.graph_objects as go
+    mean = df[c1].mean()
+    return go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=mean,
+        title={'text': opts['title'] or f"Average {c1}"},
+        delta={'reference': mean * 0.5, 'increasing': {'color': "RebeccaPurple"}},
+        gauge={'threshold': {
+            'line': {'color': "red", 'width': 4},
+            'thickness': 0.75,
+            'value': mean * 0.75}},
+    ))
+
+_BUILDERS = {
+    'bar': _build_bar,
+    'pie': _build_pie,
+    'line': _build_line,
+    'scatter': _build_scatter,
+    'dot': _build_scatter,
+    'heatmap': _build_heatmap,
+    'correlation': _build_correlation,
+    'histogram': _build_histogram,
+    'boxplot': _build_boxplot,
+    'box': _build_boxplot,
+    'violinplot': _build_violinplot,
+    'densityplot': _build_densityplot,
+    'treemap': _build_treemap,
+    'sunburst': _build_sunburst,
+    'waterfall': _build_waterfall,
+    'funnel': _build_funnel,
+    'sankey': _build_sankey,
+    'bubble': _build_bubble,
+    'radar': _build_radar,
+    'area': _build_area,
+    'gauge': _build_gauge,
+}
+
+def build_figure(df, chart_type, title=None, x_axis_label=None, y_axis_label=None, color_scale=None, bin_size=None):
+    """
+    Build the Plotly figure for a chart type without displaying it.
+
+    Parameters:
+    df (pd.DataFrame): The input DataFrame.
+    chart_type (str): The chart type, one of the keys of _BUILDERS ('bar', 'pie', 'line', 'scatter', 'heatmap', 'correlation', 'histogram', 'boxplot', 'violinplot', 'densityplot', 'treemap', 'sunburst', 'waterfall', 'funnel', 'sankey', 'bubble', 'radar', 'area', 'dot', 'gauge', ...).
+    title (str): The chart title.
+    x_axis_label (str): The x-axis label.
+    y_axis_label (str): The y-axis label.
+    color_scale (str): The color scale for heatmaps.
+    bin_size (int): The bin size for histograms.
+
+    Returns:
+    plotly.graph_objects.Figure: The figure, or None if the chart type is not supported.
+    """
+    builder = _BUILDERS.get(chart_type)
+    if builder is None:
+        return None
+
+    cols = df.columns
+    c0 = cols[0]
+    c1 = cols[1] if len(cols) > 1 else None
+    c2 = cols[2] if len(cols) > 2 else None
+    opts = dict(title=title, x_label=x_axis_label or c0, y_label=y_axis_label or c1,
+                color_scale=color_scale, bin_size=bin_size)
+
+    fig = builder(df, c0, c1, c2, opts)
+    fig.update_layout(_LAYOUT)
+    return fig
+
+def frame_key(df):
+    """
+    Cache key covering every value of a DataFrame, in row order.
+
+    Streamlit's default DataFrame hash only samples large frames, so two uploads that differ
+    outside the sample would share a figure; use this as the hash_funcs entry instead.
+
+    Parameters:
+    df (pd.DataFrame): The frame to key.
+
+    Returns:
+    tuple: The column labels, dtype names, shape and a SHA-1 of the per-row hashes.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return (tuple(df.columns), tuple(df.dtypes.map(str)), df.shape,
+            hashlib.sha1(row_hashes.tobytes()).hexdigest())
+
+# Reruns triggered by unrelated widgets get the finished figure back instead of rebuilding it;
+# the key covers the full frame contents, so any change to the data is a new entry
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: frame_key})
+def _cached_figure(df, chart_type, title, x_axis_label, y_axis_label, color_scale, bin_size):
+    return build_figure(df, chart_type, title=title, x_axis_label=x_axis_label, y_axis_label=y_axis_label,
+                        color_scale=color_scale, bin_size=bin_size)
+
+def generate_chart(df, chart_type, title=None, x_axis_label=None, y_axis_label=None, color_scale=None, bin_size=None):
+    """
+    Generate a chart based on the chart type and render it with Streamlit.
+
+    Parameters:
+    df (pd.DataFrame): The input DataFrame.
+    chart_type (str): The chart type, see build_figure for the supported values.
+    title (str): The chart title.
+    x_axis_label (str): The x-axis label.
+    y_axis_label (str): The y-axis label.
+    color_scale (str): The color scale for heatmaps.
+    bin_size (int): The bin size for histograms.
+    """
+    if chart_type is None:
+        st.write("No suitable chart type determined for this data.")
+        return
+
+    if 0 in df.shape:
+        st.write("The input DataFrame is empty.")
+        return
+
+    fig = _cached_figure(df, chart_type, title, x_axis_label, y_axis_label, color_scale, bin_size)
+    if fig is None:
+        st.write("Unsupported chart type.")
+        return
+
+    st.plotly_chart(fig, use_container_width=True)
@@ -1,93 +1,79 @@
+import io
 import streamlit as st
-import plotly.express as px
 import pandas as pd
 import numpy as np
+from charts import generate_chart
 
 st.title("📊 Dynamic Chart Generator")
 
 # Upload CSV file
 uploaded_file = st.file_uploader("Upload a CSV file", type=["csv"])
 
-# Function to determine chart type
+# Shrink numeric columns to the smallest type that holds their values, and store
+# repetitive text columns as categories, so charts and correlations move fewer bytes
+def _downcast(df):
+    for c in df.select_dtypes("integer").columns:
+        df[c] = pd.to_numeric(df[c], downcast="integer")
+    for c in df.select_dtypes("float").columns:
+        df[c] = pd.to_numeric(df[c], downcast="float")
+    for c in df.select_dtypes(include=["object", "string"]).columns:
+        if df[c].nunique() < 0.5 * len(df):
+            df[c] = df[c].astype("category")
+    return df
+
+# Parse the uploaded CSV once per distinct file instead of on every rerun,
+# keeping the Arrow buffers pyarrow produced instead of copying into numpy
+@st.cache_data(show_spinner=False)
+def _load_csv(data):
+    return _downcast(pd.read_csv(io.BytesIO(data), engine="pyarrow", dtype_backend="pyarrow"))
+
+# Function to determine chart type; the upload app recommends correlation heatmaps
+# and box plots, so it keeps its own rules instead of the shared charts table
 def determine_chart_type(df):
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    cat_cols = df.select_dtypes(exclude=[np.number]).columns.tolist()
+    nrows, ncols = df.shape
+    n_num = df.select_dtypes(include=[np.number]).shape[1]
+    n_cat = ncols - n_num
 
-    if len(df.columns) == 2:
-        if len(num_cols) == 1 and len(df) > 10:
+    if ncols == 2:
+        if n_num == 1 and nrows > 10:
             return 'histogram'
-        elif len(num_cols) == 1 and len(df) <= 10:
+        elif n_num == 1 and nrows <= 10:
             return 'pie'
-        elif len(num_cols) == 2:
+        elif n_num == 2:
             return 'scatter'
-        elif len(num_cols) == 1 and len(cat_cols) == 1:
+        elif n_num == 1 and n_cat == 1:
             return 'bar'
-    elif len(num_cols) >= 2:
-        if len(num_cols) > 2:
+    elif n_num >= 2:
+        if n_num > 2:
             return 'heatmap'
         else:
             return 'line'
-    elif len(cat_cols) > 0 and len(num_cols) > 0:
+    elif n_cat > 0 and n_num > 0:
         return 'box'
     return None
 
-# Function to generate the appropriate chart
-def generate_chart(df, chart_type):
-    if chart_type == 'bar':
-        fig = px.bar(df, x=df.columns[0], y=df.columns[1],
-                     title=f"{df.columns[0]} vs. {df.columns[1]}",
-                     template="plotly_white")
-    
-    elif chart_type == 'pie':
-        fig = px.pie(df, names=df.columns[0], values=df.columns[1],
-                     title=f"Distribution of {df.columns[0]}",
-                     template="plotly_white")
-
-    elif chart_type == 'line':
-        fig = px.line(df, x=df.columns[0], y=df.columns[1],
-                      title=f"{df.columns[1]} Over {df.columns[0]}",
-                      template="plotly_white", markers=True)
-
-    elif chart_type == 'scatter':
-        fig = px.scatter(df, x=df.columns[0], y=df.columns[1],
-                         title=f"Scatter Plot of {df.columns[0]} vs. {df.columns[1]}",
-                         template="plotly_white")
+# The upload app's heatmap is the correlation matrix of the numeric columns, which the
+# shared renderer draws as 'correlation' ('heatmap' there pivots two key columns)
+_RENDER_TYPES = {'heatmap': 'correlation'}
 
-    elif chart_type == 'histogram':
-        fig = px.histogram(df, x=df.columns[0],
-                           title=f"Distribution of {df.columns[0]}",
-                           template="plotly_white")
-
-    elif chart_type == 'box':
-        fig = px.box(df, x=df.columns[0], y=df.columns[1],
-                     title=f"Box Plot of {df.columns[0]} vs. {df.columns[1]}",
-                     template="plotly_white")
-
-    elif chart_type == 'heatmap':
-        corr_matrix = df.select_dtypes(include=[np.number]).corr()
-        fig = px.imshow(corr_matrix, 
-                        x=corr_matrix.columns,
-                        y=corr_matrix.index,
-                        color_continuous_scale='Viridis',
-                        title="Heatmap of Numerical Features")
-
-    else:
-        st.write("No suitable chart type determined for this data.")
-        return
-    
-    fig.update_layout(plot_bgcolor="rgba(0,0,0,0)")
-    st.plotly_chart(fig, use_container_width=True)
+# Titles the upload app has always used where they differ from the shared renderer's defaults
+_TITLES = {
+    'scatter': "Scatter Plot of {0} vs. {1}",
+    'histogram': "Distribution of {0}",
+    'box': "Box Plot of {0} vs. {1}",
+}
 
 # Load and display data
 if uploaded_file is not None:
-    df = pd.read_csv(uploaded_file)
+    df = _load_csv(uploaded_file.getvalue())
     st.write("### 📋 Preview of Uploaded Data", df.head())
 
     chart_type = determine_chart_type(df)
     
     if chart_type:
         st.write(f"### 📈 Recommended Chart Type: **{chart_type.capitalize()}**")
-        generate_chart(df, chart_type)
+        title = _TITLES[chart_type].format(*df.columns[:2]) if chart_type in _TITLES else None
+        generate_chart(df, _RENDER_TYPES.get(chart_type, chart_type), title=title)
     else:
         st.write("⚠️ No suitable chart type found for the dataset.")
 
@@ -1,33 +1,120 @@
+import functools
+import numpy as np
 import pandas as pd
 import streamlit as st
-import plotly.express as px
+from charts import TEXT_AUTO_MAX_CELLS, frame_key, lttb, pivot_mean
+from charts import determine_pivot_chart_type as determine_chart_type
 
-def determine_chart_type(df):
-    """
-    Determine the chart type based on the number of columns and data types.
-    
-    Parameters:
-    df (pd.DataFrame): The input DataFrame.
-    
-    Returns:
-    str: The chart type ('bar', 'pie', 'line', 'scatter', 'heatmap', or 'histogram').
-    """
-    if len(df.columns) == 1:
-        if df.dtypes[0] in ['int64', 'float64']:
-            return 'histogram'
-    elif len(df.columns) == 2:
-        if df.dtypes[0] in ['int64', 'float64'] and df.dtypes[1] in ['int64', 'float64']:
-            return 'scatter'
-        elif df.dtypes[1] in ['int64', 'float64'] and len(df) > 1:
-            return 'bar'
-        elif df.dtypes[1] in ['int64', 'float64'] and len(df) <= 10:
-            return 'pie'
-    elif len(df.columns) >= 3:
-        if df.dtypes[0] in ['object', 'category'] and df.dtypes[1] in ['object', 'category'] and df.dtypes[2] in ['int64', 'float64']:
-            return 'heatmap'
-        elif df.dtypes[1] in ['int64', 'float64']:
-            return 'line'
-    return None
+# Above this many rows scatter and line charts are thinned before plotting, and bar charts
+# with more categories than _MAX_BARS keep only the largest category totals, so the browser
+# never receives an unbounded number of marks
+_MAX_POINTS = 50_000
+_MAX_BARS = 50
+
+# Coloring bars by category makes one trace and legend entry per value, so past this many
+# distinct categories the bars are drawn as a single uncolored trace
+_MAX_COLORED_BARS = 20
+
+def _maybe_downsample(df, chart_type):
+    if chart_type == 'scatter' and len(df) > _MAX_POINTS:
+        return df.sample(n=_MAX_POINTS, random_state=0)
+    if chart_type == 'line' and len(df) > _MAX_POINTS and pd.api.types.is_numeric_dtype(df.iloc[:, 1]):
+        return df.iloc[lttb(df.iloc[:, 0].to_numpy(), df.iloc[:, 1].to_numpy(), _MAX_POINTS)]
+    if chart_type == 'bar' and df.iloc[:, 0].nunique() > _MAX_BARS:
+        c0, c1 = df.columns[:2]
+        return df.groupby(c0, observed=True, sort=False)[c1].sum().nlargest(_MAX_BARS).reset_index()
+    return df
+
+# Repeated labels become integer-coded categoricals, so Plotly's grouping and the heatmap
+# pivot work on small codes instead of hashing the same strings over and over. Like
+# Positron's Data Explorer, only the first million rows are scanned to judge repetition.
+_INFER_ROWS = 1_000_000
+
+def _to_category(df):
+    sample = df.head(_INFER_ROWS)
+    cat_cols = [c for c in sample.select_dtypes(include=["object", "string"]).columns
+                if sample[c].nunique() < 0.5 * len(sample)]
+    return df.assign(**{c: df[c].astype("category") for c in cat_cols})
+
+# The app's look is registered once as the default Plotly template, the first time a
+# figure is built, instead of merging template= and the background into every figure
+@functools.lru_cache(maxsize=None)
+def _use_app_template():
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    template = go.layout.Template(pio.templates["plotly_white"])
+    template.layout.plot_bgcolor = "rgba(0,0,0,0)"
+    pio.templates["app"] = template
+    pio.templates.default = "app"
+
+def _bar(df, c0, c1):
+    import plotly.express as px
+    use_color = df.iloc[:, 0].nunique(dropna=True) <= _MAX_COLORED_BARS
+    return px.bar(df, x=c0, y=c1,
+                  title=f"{c0} vs. {c1}",
+                  color=c0 if use_color else None)
+
+def _pie(df, c0, c1):
+    import plotly.express as px
+    return px.pie(df, names=c0, values=c1,
+                  title=f"Distribution of {c0}")
+
+# Scatter and line columns go to Plotly as plain NumPy arrays, skipping the
+# per-column pandas lookups px does on a frame; labels keep the column names on the axes
+def _line(df, c0, c1):
+    import plotly.express as px
+    return px.line(x=df.iloc[:, 0].to_numpy(), y=df.iloc[:, 1].to_numpy(),
+                   labels={'x': str(c0), 'y': str(c1)},
+                   title=f"{c1} Over {c0}",
+                   markers=True)
+
+def _scatter(df, c0, c1):
+    import plotly.express as px
+    return px.scatter(x=df.iloc[:, 0].to_numpy(), y=df.iloc[:, 1].to_numpy(),
+                      labels={'x': str(c0), 'y': str(c1)},
+                      title=f"{c0} vs. {c1}")
+
+# Averages the value column over the (first, second) key pairs in one factorize + np.add.at
+# pass instead of pivot_table's groupby/unstack; only observed keys become rows and columns
+def _heatmap(df, c0, c1):
+    import plotly.express as px
+    matrix, row_labels, col_labels = pivot_mean(df.iloc[:, 0], df.iloc[:, 1], df.iloc[:, 2])
+    return px.imshow(matrix, x=col_labels, y=row_labels,
+                     text_auto=matrix.size <= TEXT_AUTO_MAX_CELLS,
+                     title=f"Heatmap of {c0} vs. {c1}")
+
+def _histogram(df, c0, c1):
+    import plotly.graph_objects as go
+    # Bin on the server and send at most 256 bin counts instead of every raw value
+    x = df.iloc[:, 0].dropna().to_numpy(dtype=np.float64)
+    counts, edges = np.histogram(x, bins=max(1, min(256, int(np.sqrt(x.size)))))
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+    fig.update_layout(title=f"Histogram of {c0}", xaxis_title=str(c0), yaxis_title="count",
+                      bargap=0)
+    return fig
+
+# One builder per chart type, looked up once instead of walking an if/elif chain
+_BUILDERS = {
+    'bar': _bar,
+    'pie': _pie,
+    'line': _line,
+    'scatter': _scatter,
+    'heatmap': _heatmap,
+    'histogram': _histogram,
+}
+
+# The pandas -> Plotly conversion is the expensive part of a render, so the finished figure is
+# cached per (frame contents, chart type) and reruns with unchanged data reuse it
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: frame_key})
+def _build_figure(df, chart_type):
+    _use_app_template()
+    df = _maybe_downsample(df, chart_type)
+    if chart_type in ('bar', 'pie', 'heatmap'):
+        df = _to_category(df)
+    cols = df.columns
+    c0 = cols[0]
+    c1 = cols[1] if len(cols) > 1 else None
+    return _BUILDERS[chart_type](df, c0, c1)
 
 def generate_chart(df, chart_type):
     """
@@ -41,67 +128,38 @@ def generate_chart(df, chart_type):
         st.write("No suitable chart type determined for this data.")
         return
     
-    if df.empty:
+    if 0 in df.shape:
         st.write("The input DataFrame is empty.")
         return
     
-    if chart_type == 'bar':
-        fig = px.bar(df, x=df.columns[0], y=df.columns[1],
-                     title=f"{df.columns[0]} vs. {df.columns[1]}",
-                     template="plotly_white", color=df.columns[0])
-    elif chart_type == 'pie':
-        fig = px.pie(df, names=df.columns[0], values=df.columns[1],
-                     title=f"Distribution of {df.columns[0]}",
-                     template="plotly_white")
-    elif chart_type == 'line':
-        fig = px.line(df, x=df.columns[0], y=df.columns[1],
-                      title=f"{df.columns[1]} Over {df.columns[0]}",
-                      template="plotly_white", markers=True)
-    elif chart_type == 'scatter':
-        fig = px.scatter(df, x=df.columns[0], y=df.columns[1],
-                         title=f"{df.columns[0]} vs. {df.columns[1]}",
-                         template="plotly_white")
-    elif chart_type == 'heatmap':
-        fig = px.imshow(df.pivot_table(index=df.columns[0], columns=df.columns[1], values=df.columns[2]),
-                         text_auto=True,
-                         title=f"Heatmap of {df.columns[0]} vs. {df.columns[1]}",
-                         template="plotly_white")
-    elif chart_type == 'histogram':
-        fig = px.histogram(df, x=df.columns[0],
-                           title=f"Histogram of {df.columns[0]}",
-                           template="plotly_white")
-    else:
+    if chart_type not in _BUILDERS:
         st.write("Unsupported chart type.")
         return
-    
-    fig.update_layout(plot_bgcolor="rgba(0,0,0,0)")
-    st.plotly_chart(fig, use_container_width=True)
+
+    fig = _build_figure(df, chart_type)
+    # theme=None keeps the app template instead of Streamlit restyling the figure over it
+    st.plotly_chart(fig, use_container_width=True, theme=None)
 
 # Example usage:
-df = pd.DataFrame({
+df1 = pd.DataFrame({
     'Category': ['A', 'B', 'C', 'D', 'E'],
     'Value': [10, 20, 30, 40, 50]
 })
-chart_type = determine_chart_type(df)
-generate_chart(df, chart_type)
 
 df2 = pd.DataFrame({
     'X': [1, 2, 3, 4, 5],
     'Y': [2, 4, 6, 8, 10]
 })
-chart_type2 = determine_chart_type(df2)
-generate_chart(df2, chart_type2)
 
 df3 = pd.DataFrame({
     'Category1': ['A', 'B', 'C', 'D', 'E'],
     'Category2': ['X', 'Y', 'Z', 'W', 'V'],
     'Value': [10, 20, 30, 40, 50]
 })
-chart_type3 = determine_chart_type(df3)
-generate_chart(df3, chart_type3)
 
 df4 = pd.DataFrame({
     'Value': [10, 20, 30, 40, 50]
 })
-chart_type4 = determine_chart_type(df4)
-generate_chart(df4, chart_type4)
\ No newline at end of file
+
+for df in (df1, df2, df3, df4):
+    generate_chart(df, determine_chart_type(df))